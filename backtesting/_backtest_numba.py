@@ -0,0 +1,98 @@
+"""
+Numba walk-forward kernel - the numerical core of RollingWindowBacktest
+Runs every raw signal on one underlying in parallel, one signal per thread
+"""
+
+import numpy as np
+
+from utils._njit import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def run_all(raw_signals, prices, returns, volatility, starts, train_window, test_window, notional_budget, transaction_cost):
+    """
+    Walk-forward backtest of every raw signal at once
+
+    Args:
+        raw_signals (np.ndarray): Raw (unscaled) signal over the full price history, one row per signal
+        prices (np.ndarray): Full price history (float32 or float64)
+        returns (np.ndarray): Daily returns aligned with prices (first entry NaN)
+        volatility (np.ndarray): Annualized volatility aligned with prices
+        starts (np.ndarray): Test window start positions, see window_starts()
+        train_window (int): Days for training period
+        test_window (int): Days for testing period
+        notional_budget (float): Vol target * capital
+        transaction_cost (float): Transaction cost as decimal
+
+    Returns:
+        np.ndarray: Shape (4, n_signals, n_windows, test_window) holding forecasts,
+                    positions, net returns and costs. Undefined entries are NaN.
+    """
+    output = np.full((4, len(raw_signals), len(starts), test_window), np.nan, dtype=prices.dtype)
+
+    # Loop invariants: position per forecast point (forecast / 10 scaling folded in)
+    # and instrument currency volatility, shared by every signal
+    position_per_forecast = notional_budget / 10.0
+    instrument_currency_vol = volatility * prices
+
+    for v in prange(len(raw_signals)):
+        raw_signal = raw_signals[v]
+
+        for k in range(len(starts)):
+            start = starts[k]
+            # Scale forecasts to an average absolute value of 10 on the training window
+            # (NaN rows from missing prices are left out, like pandas mean())
+            scaling_factor = 10.0 / np.nanmean(np.abs(raw_signal[start - train_window : start]))
+            prev_position = np.nan
+
+            for j in range(test_window):
+                t = start + j
+                forecast = min(max(raw_signal[t] * scaling_factor, -20.0), 20.0)
+                position = position_per_forecast * forecast / instrument_currency_vol[t]
+                output[0, v, k, j] = forecast
+                output[1, v, k, j] = position
+
+                # First day of each test window has no prior position
+                if j > 0:
+                    cost = abs(position - prev_position) * transaction_cost
+                    output[2, v, k, j] = prev_position * returns[t] - cost
+                    output[3, v, k, j] = cost
+                prev_position = position
+
+    return output
+
+
+@njit(cache=True)
+def fused_metrics(returns):
+    """
+    Mean, standard deviation, compounded growth and max drawdown in one pass
+
+    Uses Welford's algorithm for the mean/variance and a running peak of the
+    compounded equity curve for the drawdown.
+
+    Args:
+        returns (np.ndarray): Daily returns (float64, no NaNs)
+
+    Returns:
+        tuple: (mean, std (ddof=1), final cumulative growth, max drawdown)
+    """
+    mean = 0.0
+    m2 = 0.0
+    cumulative = 1.0
+    peak = -np.inf
+    max_drawdown = 0.0
+    for i in range(len(returns)):
+        r = returns[i]
+        delta = r - mean
+        mean += delta / (i + 1)
+        m2 += delta * (r - mean)
+
+        cumulative *= 1.0 + r
+        peak = max(peak, cumulative)
+        max_drawdown = min(max_drawdown, (cumulative - peak) / peak)
+
+    n = len(returns)
+    if n == 0:
+        mean = np.nan
+    std = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+    return mean, std, cumulative, max_drawdown
@@ -1,6 +1,93 @@
 import pandas as pd
 import numpy as np
 
+from backtesting import _backtest_numba
+from utils._aot import load_kernel
+
+fused_metrics = load_kernel(_backtest_numba.fused_metrics)
+
+
+def window_starts(n_prices, train_window, test_window):
+    """
+    Start position of every walk-forward test window
+
+    Window k trains on [starts[k] - train_window, starts[k]) and tests on
+    [starts[k], starts[k] + test_window).
+
+    Args:
+        n_prices (int): Length of the price history
+        train_window (int): Days for training period
+        test_window (int): Days for testing period
+
+    Returns:
+        np.ndarray: Test window start positions
+    """
+    return np.arange(train_window, n_prices - test_window, test_window)
+
+
+def run_backtests(backtests, prices, capital=100000, transaction_cost=0.0001, precomputed_vol=None):
+    """
+    Run several walk-forward backtests on the same prices in one parallel pass
+
+    The backtests must share their windows, precision and sizing and differ only
+    in their signals. RollingWindowBacktest.run is the single backtest case.
+
+    Args:
+        backtests (list): RollingWindowBacktest objects
+        prices (pd.Series): Daily price data with datetime index
+        capital (float): Initial capital
+        transaction_cost (float): Transaction cost as decimal (default 0.0001 = 1 bps)
+        precomputed_vol (np.ndarray, optional): Annualized volatility over the full price
+                                                history. If None, calculated by the sizing object.
+
+    Returns:
+        list: One results dict per backtest, see RollingWindowBacktest.run
+    """
+    if not backtests:
+        return []
+
+    first = backtests[0]
+    for backtest in backtests[1:]:
+        if (
+            (backtest.train_window, backtest.test_window, np.dtype(backtest.dtype))
+            != (first.train_window, first.test_window, np.dtype(first.dtype))
+            or vars(backtest.sizing) != vars(first.sizing)
+        ):
+            raise ValueError("Backtests run together must share windows, dtype and sizing")
+
+    dtype = first.dtype
+    prices_np = prices.to_numpy(dtype=dtype)
+    starts = window_starts(len(prices), first.train_window, first.test_window)
+
+    # Daily returns and volatility are computed once over the full history, shared by every signal
+    returns = np.empty_like(prices_np)
+    returns[:1] = np.nan
+    np.divide(prices_np[1:], prices_np[:-1], out=returns[1:])
+    returns[1:] -= 1
+
+    if precomputed_vol is None:
+        precomputed_vol = first.sizing.precompute_volatility(prices, dtype=dtype, returns=returns)
+    volatility = np.asarray(precomputed_vol, dtype=dtype)
+
+    # Raw signals are computed once over the full history and sliced per window inside the kernel
+    raw_signals = np.empty((len(backtests), len(prices)), dtype=dtype)
+    for k, backtest in enumerate(backtests):
+        raw_signals[k] = backtest.signal.precompute(prices, dtype=dtype).to_numpy()
+
+    output = _backtest_numba.run_all(
+        raw_signals,
+        prices_np,
+        returns,
+        volatility,
+        starts,
+        first.train_window,
+        first.test_window,
+        first.sizing.vol_target * capital,
+        transaction_cost,
+    )
+
+    return [backtest.collect_results(output[:, k], prices) for k, backtest in enumerate(backtests)]
+
 
 class RollingWindowBacktest:
     """
@@ -12,28 +99,34 @@ class RollingWindowBacktest:
     - Roll forward and repeat
 
     Attributes:
-        signal: Signal generator object (must have get_forecast method)
-        sizing: Position sizing object (must have get_position_size method)
+        signal: Signal generator object (must have a precompute method)
+        sizing: Position sizing object (must have a precompute_volatility method and vol_target)
         train_window (int): Training period in days (default 252 = 1 year)
         test_window (int): Testing period in days (default 63 = 3 months)
+        dtype (np.dtype): Float precision of the backtest arithmetic (default float32)
     """
 
-    def __init__(self, signal, sizing, train_window=252, test_window=63):
+    def __init__(self, signal, sizing, train_window=252, test_window=63, dtype=np.float32):
         """
         Initialize rolling window backtest
 
         Args:
-            signal: Signal generator with get_forecast(prices, train_prices) method
-            sizing: Position sizing with get_position_size(forecast, prices, capital) method
+            signal: Signal generator with a precompute(prices, dtype) method returning
+                    the raw (unscaled) signal; run_all scales it on each training window
+            sizing: Position sizing with a precompute_volatility(prices, dtype) method
+                    and a vol_target attribute
             train_window (int): Days for training period
             test_window (int): Days for testing period
+            dtype (np.dtype): Float precision for signals, sizing and returns. float32 halves
+                              memory traffic; metrics are always calculated in float64.
         """
         self.signal = signal
         self.sizing = sizing
         self.train_window = train_window
         self.test_window = test_window
+        self.dtype = dtype
 
-    def run(self, prices, capital=100000, transaction_cost=0.0001):
+    def run(self, prices, capital=100000, transaction_cost=0.0001, precomputed_vol=None):
         """
         Run walk-forward backtest
 
@@ -41,59 +134,44 @@ class RollingWindowBacktest:
             prices (pd.Series): Daily price data with datetime index
             capital (float): Initial capital
             transaction_cost (float): Transaction cost as decimal (default 0.0001 = 1 bps)
+            precomputed_vol (np.ndarray, optional): Annualized volatility over the full price
+                                                    history, shared across strategy variations.
+                                                    If None, calculated by the sizing object.
 
         Returns:
             dict: Contains 'returns', 'forecasts', 'positions', 'cumulative_returns'
         """
-        all_forecasts = []
-        all_positions = []
-        all_returns = []
-        all_costs = []
-        timestamps = []
-
-        # Walk forward through data
-        for i in range(self.train_window, len(prices) - self.test_window, self.test_window):
-            # Split into train and test
-            train_prices = prices.iloc[i - self.train_window : i]
-            test_prices = prices.iloc[i : i + self.test_window]
-
-            # Get signal from training data
-            forecast = self.signal.get_forecast(test_prices, train_data=train_prices)
-
-            # Size positions based on forecast
-            positions = self.sizing.get_position_size(forecast, test_prices, capital)
-
-            # Calculate returns
-            test_returns = test_prices.pct_change()
-            strategy_returns = positions.shift(1) * test_returns
-
-            # Calculate transaction costs
-            position_changes = positions.diff().abs()
-            costs = position_changes * transaction_cost # costs proportional to size of bets
-
-            # Net returns after costs
-            net_returns = strategy_returns - costs
-
-            # Store results
-            valid_idx = net_returns.dropna().index
-            all_forecasts.extend(forecast.loc[valid_idx].values)
-            all_positions.extend(positions.loc[valid_idx].values)
-            all_returns.extend(net_returns.loc[valid_idx].values)
-            all_costs.extend(costs.loc[valid_idx].values)
-            timestamps.extend(valid_idx)
-
-        # Create result series with datetime index
-        result_index = pd.DatetimeIndex(timestamps)
+        return run_backtests([self], prices, capital, transaction_cost, precomputed_vol)[0]
+
+    def collect_results(self, output, prices):
+        """
+        Flatten per-window backtest output into time-indexed result series
+
+        Args:
+            output (np.ndarray): Shape (4, n_windows, test_window) block of forecasts,
+                                 positions, net returns and costs (NaN where undefined)
+            prices (pd.Series): Price data the backtest was run on
+
+        Returns:
+            dict: Contains 'returns', 'forecasts', 'positions', 'costs', 'cumulative_returns'
+        """
+        starts = window_starts(len(prices), self.train_window, self.test_window)
+        test_idx = starts[:, None] + np.arange(self.test_window)
+
+        # Flatten windows back into one time-ordered series with a single gather, dropping undefined rows
+        valid = ~np.isnan(output[2])
+        forecasts, positions, net_returns, costs = output[:, valid]
+        result_index = prices.index[test_idx[valid]]
 
         results = {
-            "returns": pd.Series(all_returns, index=result_index),
-            "forecasts": pd.Series(all_forecasts, index=result_index),
-            "positions": pd.Series(all_positions, index=result_index),
-            "costs": pd.Series(all_costs, index=result_index),
+            "returns": pd.Series(net_returns, index=result_index),
+            "forecasts": pd.Series(forecasts, index=result_index),
+            "positions": pd.Series(positions, index=result_index),
+            "costs": pd.Series(costs, index=result_index),
         }
 
         # Calculate cumulative returns
-        results["cumulative_returns"] = (1 + results["returns"]).cumprod()
+        results["cumulative_returns"] = (1 + results["returns"].astype(np.float64)).cumprod()
 
         return results
 
@@ -107,35 +185,31 @@ class RollingWindowBacktest:
         Returns:
             dict: Performance metrics
         """
-        returns = results["returns"]
+        # Metrics are always calculated in float64, whatever the backtest precision
+        r = results["returns"].to_numpy(dtype=np.float64)
+
+        # Mean, volatility, compounded return and drawdown in a single pass
+        mean, std_dev, cumulative, max_drawdown = fused_metrics(r)
 
         # Avoid division by zero
-        if returns.std() == 0 or len(returns) == 0:
+        if len(r) == 0 or std_dev == 0:
             return None
 
         # Calculate metrics
-        sharpe = returns.mean() / returns.std() * np.sqrt(256)
-        total_return = (1 + returns).cumprod().iloc[-1] - 1
-        annual_return = returns.mean() * 256
-
-        # Drawdown
-        cumulative = (1 + returns).cumprod()
-        running_max = cumulative.expanding().max()
-        drawdown = (cumulative - running_max) / running_max
-        max_drawdown = drawdown.min()
-
-        # Additional metrics
-        win_rate = (returns > 0).sum() / len(returns)
-        avg_win = returns[returns > 0].mean() if (returns > 0).any() else 0
-        avg_loss = returns[returns < 0].mean() if (returns < 0).any() else 0
-        profit_factor = (
-            (returns[returns > 0].sum() / returns[returns < 0].abs().sum())
-            if (returns < 0).any()
-            else np.inf
-        )
+        sharpe = mean / std_dev * np.sqrt(256)
+        total_return = cumulative - 1
+        annual_return = mean * 256
+
+        # Additional metrics (masks built once and shared)
+        wins = r[r > 0]
+        losses = r[r < 0]
+        win_rate = len(wins) / len(r)
+        avg_win = wins.mean() if len(wins) else 0
+        avg_loss = losses.mean() if len(losses) else 0
+        profit_factor = wins.sum() / -losses.sum() if len(losses) else np.inf
 
         # Transaction costs
-        total_costs = results["costs"].sum()
+        total_costs = results["costs"].to_numpy(dtype=np.float64).sum()
 
         metrics = {
             "sharpe_ratio": sharpe,
@@ -146,9 +220,9 @@ class RollingWindowBacktest:
             "avg_win": avg_win,
             "avg_loss": avg_loss,
             "profit_factor": profit_factor,
-            "std_dev": returns.std(),
+            "std_dev": std_dev,
             "total_costs": total_costs,
-            "num_trades": len(returns),
+            "num_trades": len(r),
         }
 
         return metrics
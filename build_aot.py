@@ -0,0 +1,49 @@
+"""
+Ahead-of-time compile the Numba kernels into the backtest_kernels extension module
+
+Run once per machine / Python version:  python build_aot.py
+The compiled module is written next to this script and picked up automatically,
+removing the JIT warmup on first use. Without it the @njit kernels are used.
+Rebuild after editing the kernels: an out-of-date build is ignored with a warning.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from signals import _ewma_numba
+from backtesting import _backtest_numba
+from utils._aot import source_hash
+
+# (kernel, signature) with {t} substituted by each float type, exported as <name>_f4 / <name>_f8
+# run_all is left to @njit(cache=True): AOT compilation has no parallel backend for prange
+KERNELS = [
+    (_ewma_numba.ewm_std_rows, "{t}[:, :]({t}[:, :], i8)"),
+    (_ewma_numba.ewma_cross_alpha, "{t}[:]({t}[:], f8, f8)"),
+    (_backtest_numba.fused_metrics, "UniTuple(f8, 4)({t}[:])"),
+]
+
+
+def build(output_dir=None):
+    """
+    Compile every kernel in KERNELS for float32 and float64
+
+    Args:
+        output_dir (str, optional): Where to write the extension module (default: repo root)
+    """
+    cc = CC("backtest_kernels")
+    cc.output_dir = output_dir or os.path.dirname(os.path.abspath(__file__))
+
+    for kernel, signature in KERNELS:
+        for t in ("f4", "f8"):
+            cc.export(f"{kernel.__name__}_{t}", signature.format(t=t))(kernel.py_func)
+
+    # Checked by utils._aot on import, a mismatch means the kernels changed since this build
+    built_hash = source_hash()
+    cc.export("source_hash", "i8()")(lambda: built_hash)
+
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build()
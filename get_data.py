@@ -1,4 +1,5 @@
 import ccxt
+import numpy as np
 import pandas as pd
 from datetime import datetime
 import os
@@ -32,15 +33,14 @@ def get_data(symbol, timeframe, limit=1000, output_dir = output_dir):
         # Fetch OHLCV data
         ohlcv = exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
 
-        # Convert to DataFrame
+        # Convert to DataFrame straight from a 2-D array
+        data = np.asarray(ohlcv, dtype=np.float64)
         df = pd.DataFrame(
-            ohlcv,
-            columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
+            data[:, 1:],
+            columns=['open', 'high', 'low', 'close', 'volume'],
+            index=pd.to_datetime(data[:, 0].astype(np.int64), unit='ms')
         )
-
-        # Convert timestamp to datetime
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-        df.set_index('timestamp', inplace=True)
+        df.index.name = 'timestamp'
 
         print(f"Successfully fetched {len(df)} candles")
         print(f"Date range: {df.index[0]} to {df.index[-1]}")
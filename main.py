@@ -14,59 +14,65 @@ import seaborn as sns
 import matplotlib.pyplot as plt
 from signals.ewma_signal import EWMASignal
 from position_sizing.vol_target_sizing import VolTargetSizing
-from backtesting.rolling_window_backtest import RollingWindowBacktest
-# from portfolio_u.portfolio_optimizer import PortfolioOptimizer
+from backtesting.rolling_window_backtest import RollingWindowBacktest, run_backtests
+from portfolio_u.portfolio_optimizer import PortfolioOptimizer
 
 
 def load_data(filepath):
-    """Load crypto data from CSV"""
-    df = pd.read_csv(
-        filepath,
-        index_col='timestamp',
-        parse_dates=True
+    """Load crypto data from CSV (parsed with pyarrow when it is installed)"""
+    read_kwargs = dict(
+        usecols=['timestamp', 'close'],
+        parse_dates=['timestamp'],
+        dtype={'close': np.float64}
     )
-    return df['close']
+    try:
+        df = pd.read_csv(filepath, engine='pyarrow', **read_kwargs)
+    except ImportError:
+        df = pd.read_csv(filepath, **read_kwargs)
+    return df.set_index('timestamp')['close']
 
 
-def run_single_strategy(prices, fast, slow, vol_target, capital):
+def run_all_strategies(prices, ewma_variations, vol_target, capital, precomputed_vol=None):
     """
-    Run a single EWMA strategy with rolling window backtest
+    Run every EWMA variation with rolling window backtests in one parallel pass
 
     Args:
         prices (pd.Series): Price data
-        fast (int): Fast EMA span
-        slow (int): Slow EMA span
+        ewma_variations (list): (fast, slow) EMA span pairs
         vol_target (float): Volatility target
         capital (float): Initial capital
+        precomputed_vol (np.ndarray, optional): Volatility of prices shared across variations
 
     Returns:
-        dict: Results containing returns, forecasts, positions, metrics
+        dict: {label: result} with each result containing signal, results, metrics, backtest
     """
-    # Create signal generator
-    signal = EWMASignal(fast=fast, slow=slow)
-
-    # Create position sizing
+    # Create position sizing, shared by every variation
     sizing = VolTargetSizing(vol_target=vol_target)
 
-    # Create backtest
-    backtest = RollingWindowBacktest(
-        signal=signal,
-        sizing=sizing,
-        train_window=252,  # 1 year training
-        test_window=63     # 3 months testing
-    )
-
-    # Run backtest
-    results = backtest.run(prices, capital=capital, transaction_cost=0.0001)
+    # Create one backtest per signal generator
+    backtests = [
+        RollingWindowBacktest(
+            signal=EWMASignal(fast=fast, slow=slow),
+            sizing=sizing,
+            train_window=252,  # 1 year training
+            test_window=63     # 3 months testing
+        )
+        for fast, slow in ewma_variations
+    ]
 
-    # Calculate metrics
-    metrics = backtest.calculate_metrics(results)
+    # Run backtests
+    all_results = run_backtests(
+        backtests, prices, capital=capital, transaction_cost=0.0001, precomputed_vol=precomputed_vol
+    )
 
     return {
-        'signal': signal,
-        'results': results,
-        'metrics': metrics,
-        'backtest': backtest
+        backtest.signal.name: {
+            'signal': backtest.signal,
+            'results': results,
+            'metrics': backtest.calculate_metrics(results),
+            'backtest': backtest
+        }
+        for backtest, results in zip(backtests, all_results)
     }
 
 
@@ -102,16 +108,15 @@ def main():
     print("\n[2/3] Running rolling window backtests...")
     print("-" * 70)
 
-    all_results = {}
+    # Volatility depends only on the underlying, so compute it once for all variations
+    volatility = VolTargetSizing(vol_target=VOL_TARGET).precompute_volatility(prices)
+
+    all_results = run_all_strategies(prices, ewma_variations, VOL_TARGET, CAPITAL, precomputed_vol=volatility)
     all_forecasts = {}
 
-    for fast, slow in ewma_variations:
-        label = f"EWMA_{fast}_{slow}"
+    for label, result in all_results.items():
         print(f"\n  Testing {label}...")
 
-        result = run_single_strategy(prices, fast, slow, VOL_TARGET, CAPITAL)
-
-        all_results[label] = result
         all_forecasts[label] = result['results']['forecasts']
 
         # Print metrics
@@ -124,16 +129,19 @@ def main():
             print(f"    Win Rate:         {metrics['win_rate']:>8.1%}")
             print(f"    Profit Factor:    {metrics['profit_factor']:>8.2f}")
 
-    # # Portfolio analysis
-    # print("\n[3/3] Portfolio analysis (Carver's FDM approach)...")
-    # print("-" * 70)
+    # Align all forecasts once, reused for correlations, combination and plotting
+    forecasts_df = pd.DataFrame(all_forecasts)
+
+    # Portfolio analysis
+    print("\n[3/3] Portfolio analysis (Carver's FDM approach)...")
+    print("-" * 70)
 
-    # optimizer = PortfolioOptimizer()
-    # correlations = optimizer.calculate_correlations(all_forecasts)
-    # optimizer.print_summary(correlations)
+    optimizer = PortfolioOptimizer()
+    correlations = optimizer.calculate_correlations(forecasts_df)
+    optimizer.print_summary()
 
-    # # Combine forecasts
-    # combined_forecast = optimizer.combine_forecasts(all_forecasts)
+    # Combine forecasts
+    combined_forecast = optimizer.combine_forecasts(forecasts_df)
 
     # # Print final summary table
     # print("\n" + "=" * 70)
@@ -156,20 +164,20 @@ def main():
     # summary_df = pd.DataFrame(summary_data).T
     # print(summary_df.round(3))
 
-    forecasts_df = pd.DataFrame(all_forecasts)
-
-    # Calculate pairwise forecast correlations (Carver's preference for FDM)
-    forecast_correlations = forecasts_df.corr()
-
-    # Plotting correlation matrix across variations 
+    # Plotting correlation matrix across variations, reusing the optimizer's pairwise
+    # forecast correlations (Carver's preference for FDM)
     plt.figure(figsize=(12,10))
-    sns.heatmap(forecast_correlations, annot=True)
+    sns.heatmap(
+        correlations.values,
+        annot=True,
+        xticklabels=correlations.columns,
+        yticklabels=correlations.index
+    )
     plt.title('Forecast Correlations between EWMA variations')
     plt.tight_layout()
     plt.show()
 
-    # , combined_forecast -> insert this when portfolio optimiser is confirmed 
-    return all_results, correlations
+    return all_results, correlations, combined_forecast
 
 
 if __name__ == "__main__":
@@ -29,20 +29,56 @@ class PortfolioOptimizer:
         """
         self.min_correlation = min_correlation
         self.leverage = leverage
+        self.correlations = None
 
-    def calculate_correlations(self, forecasts_dict):
+    def _to_frame(self, forecasts):
+        """
+        Align forecasts into a DataFrame, reusing it if one is passed in
+
+        Args:
+            forecasts (dict or pd.DataFrame): {signal_name: forecast_series} or aligned forecasts
+
+        Returns:
+            pd.DataFrame: One column per signal
+        """
+        if isinstance(forecasts, pd.DataFrame):
+            return forecasts
+        return pd.DataFrame(forecasts)
+
+    def calculate_correlations(self, forecasts):
         """
         Calculate correlations between forecasts
 
+        The result is kept on the optimizer for print_summary().
+
         Args:
-            forecasts_dict (dict): Dictionary of {signal_name: forecast_series}
+            forecasts (dict or pd.DataFrame): {signal_name: forecast_series} or aligned forecasts
 
         Returns:
             pd.DataFrame: Correlation matrix
         """
-        forecasts_df = pd.DataFrame(forecasts_dict)
-        correlations = forecasts_df.corr()
-        return correlations
+        # Forecasts share one walk-forward index, so dropping incomplete rows once
+        # leaves a dense matrix for a single vectorized corrcoef
+        forecasts_df = self._to_frame(forecasts).dropna()
+        correlations = np.corrcoef(forecasts_df.to_numpy(), rowvar=False)
+        self.correlations = pd.DataFrame(
+            np.atleast_2d(correlations), index=forecasts_df.columns, columns=forecasts_df.columns
+        )
+        return self.correlations
+
+    def average_correlation(self, correlation_matrix):
+        """
+        Average pairwise correlation, excluding the diagonal
+
+        Args:
+            correlation_matrix (pd.DataFrame): Correlation matrix of forecasts
+
+        Returns:
+            float: Mean of the off-diagonal correlations
+        """
+        c = np.asarray(correlation_matrix)
+        n = c.shape[0]
+        return (c.sum() - np.trace(c)) / (c.size - n)
 
     def calculate_fdm(self, correlation_matrix):
         """
@@ -57,8 +93,7 @@ class PortfolioOptimizer:
             float: Diversification multiplier
         """
         # Get average correlation (excluding diagonal)
-        mask = ~np.eye(correlation_matrix.shape[0], dtype=bool)
-        avg_correlation = correlation_matrix.values[mask].mean()
+        avg_correlation = self.average_correlation(correlation_matrix)
 
         # Avoid division by zero or negative correlations
         avg_correlation = max(avg_correlation, 0.0)
@@ -67,18 +102,18 @@ class PortfolioOptimizer:
 
         return fdm
 
-    def combine_forecasts(self, forecasts_dict, correlation_weights=None):
+    def combine_forecasts(self, forecasts, correlation_weights=None):
         """
         Combine multiple forecasts into single portfolio forecast
 
         Args:
-            forecasts_dict (dict): Dictionary of {signal_name: forecast_series}
+            forecasts (dict or pd.DataFrame): {signal_name: forecast_series} or aligned forecasts
             correlation_weights (dict, optional): Custom weights. If None, equal weight.
 
         Returns:
             pd.Series: Combined forecast
         """
-        forecasts_df = pd.DataFrame(forecasts_dict)
+        forecasts_df = self._to_frame(forecasts)
 
         if correlation_weights is None:
             # Equal weight
@@ -94,13 +129,17 @@ class PortfolioOptimizer:
 
         return combined
 
-    def print_summary(self, correlation_matrix):
+    def print_summary(self, correlation_matrix=None):
         """
         Print portfolio analysis summary
 
         Args:
-            correlation_matrix (pd.DataFrame): Correlation matrix
+            correlation_matrix (pd.DataFrame, optional): Correlation matrix. If None, uses the
+                                                         one from the last calculate_correlations().
         """
+        if correlation_matrix is None:
+            correlation_matrix = self.correlations
+
         fdm = self.calculate_fdm(correlation_matrix)
 
         print("\n" + "=" * 60)
@@ -111,7 +150,7 @@ class PortfolioOptimizer:
         print("\n" + "=" * 60)
         print("PORTFOLIO ANALYSIS")
         print("=" * 60)
-        print(f"Average Correlation: {correlation_matrix.values[~np.eye(len(correlation_matrix), dtype=bool)].mean():.3f}")
+        print(f"Average Correlation: {self.average_correlation(correlation_matrix):.3f}")
         print(f"Forecast Diversification Multiplier (FDM): {fdm:.3f}")
         print(f"  → Forecasts are {fdm:.1f}x more powerful when combined")
         print(f"  → FDM of 1.0 = forecasts uncorrelated")
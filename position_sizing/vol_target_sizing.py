@@ -6,6 +6,11 @@ Converts forecasts (0-20 scale) to position sizes based on volatility targeting
 import pandas as pd
 import numpy as np
 
+from signals import _ewma_numba
+from utils._aot import load_kernel
+
+ewm_std_rows = load_kernel(_ewma_numba.ewm_std_rows, ndim=2)
+
 
 class VolTargetSizing:
     """
@@ -30,44 +35,89 @@ class VolTargetSizing:
         self.vol_target = vol_target
         self.lookback = lookback
 
-    def calculate_volatility(self, prices):
+    def calculate_volatility(self, prices, returns=None):
         """
         Calculate annualized volatility
 
         Args:
-            prices (pd.Series): Price data
+            prices (pd.Series or np.ndarray): Price data. 2-D arrays hold one
+                                              window per row, each treated independently.
+            returns (np.ndarray, optional): Daily returns of prices (first entry NaN) when
+                                            the caller has already calculated them.
+                                            If None, calculated from prices.
 
         Returns:
-            pd.Series: Annualized volatility
+            pd.Series or np.ndarray: Annualized volatility, same shape as prices
         """
-        returns = prices.pct_change()
-        volatility = returns.ewm(span=self.lookback, adjust=False).std() * np.sqrt(256)
-        return volatility
-
-    def get_position_size(self, forecast, prices, capital):
+        if isinstance(prices, pd.Series):
+            volatility = self.calculate_volatility(prices.to_numpy(dtype=np.float64), returns)
+            return pd.Series(volatility, index=prices.index)
+
+        if returns is None:
+            returns = np.full(prices.shape, np.nan, dtype=prices.dtype)
+            returns[..., 1:] = prices[..., 1:] / prices[..., :-1] - 1
+        if returns.size == 0:
+            return np.empty_like(returns)  # nothing to smooth, and reshape(-1, 0) is ambiguous
+        volatility = ewm_std_rows(returns.reshape(-1, returns.shape[-1]), self.lookback)
+        return volatility.reshape(returns.shape) * np.sqrt(256)
+
+    def precompute_volatility(self, prices, dtype=np.float64, returns=None):
         """
-        Convert forecast to position size in dollars
+        Calculate annualized volatility once over the full price history
+
+        The result depends only on the prices and lookback, so it can be shared by
+        every strategy variation run on the same underlying: compute it once and pass
+        it to each backtest as precomputed_vol.
 
         Args:
-            forecast (pd.Series): Forecast values (-20 to 20 scale)
-            prices (pd.Series): Asset prices
-            capital (float): Total capital/portfolio value
+            prices (pd.Series or np.ndarray): Full price history
+            dtype (np.dtype): Float precision of the calculation (float32 or float64)
+            returns (np.ndarray, optional): Daily returns of prices already calculated by
+                                            the caller. If None, calculated from prices.
 
         Returns:
-            pd.Series: Position sizes in dollars (can be negative for shorts)
+            np.ndarray: Annualized volatility
         """
-        # Calculate volatility
-        volatility = self.calculate_volatility(prices)
+        if returns is not None:
+            returns = np.asarray(returns, dtype=dtype)
+        return self.calculate_volatility(np.asarray(prices, dtype=dtype), returns)
 
-        # Instrument currency volatility (dollar terms)
-        instrument_currency_vol = volatility * prices
-
-        # Desired notional position
-        notional_position = (self.vol_target * capital) / instrument_currency_vol
+    def get_position_size(self, forecast, prices, capital, precomputed_vol=None):
+        """
+        Convert forecast to position size in dollars
 
-        # Scale by forecast (forecast is -20 to 20, divide by 10 to get -2 to 2 multiplier)
-        positions = notional_position * (forecast / 10)
+        Args:
+            forecast (pd.Series or np.ndarray): Forecast values (-20 to 20 scale)
+            prices (pd.Series or np.ndarray): Asset prices, same shape as forecast
+            capital (float): Total capital/portfolio value
+            precomputed_vol (np.ndarray, optional): Annualized volatility aligned with prices,
+                                                    e.g. from precompute_volatility(). If None,
+                                                    it is calculated from prices.
 
+        Returns:
+            pd.Series or np.ndarray: Position sizes in dollars (can be negative for shorts)
+        """
+        # Keep float32 inputs in float32, anything else is calculated in float64
+        dtype = np.result_type(forecast, prices, np.float32)
+        p = np.asarray(prices, dtype=dtype)
+        f = np.asarray(forecast, dtype=dtype)
+
+        # Calculate volatility unless already provided
+        if precomputed_vol is not None:
+            volatility = np.asarray(precomputed_vol, dtype=dtype)
+        else:
+            volatility = self.calculate_volatility(p)
+
+        # Position = (Vol Target * Capital) * (Forecast / 10) / (Volatility * Price),
+        # evaluated in place in a single buffer instead of one Series per step
+        positions = np.empty(np.broadcast(f, p).shape, dtype=dtype)
+        np.multiply(volatility, p, out=positions)  # instrument currency vol (dollar terms)
+        positions *= 10  # forecast is -20 to 20, divide by 10 to get -2 to 2 multiplier
+        np.divide(f, positions, out=positions)
+        positions *= self.vol_target * capital
+
+        if isinstance(prices, pd.Series):
+            return pd.Series(positions, index=prices.index)
         return positions
 
     def get_leverage(self, position_size, prices, capital):
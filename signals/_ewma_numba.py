@@ -0,0 +1,128 @@
+"""
+Numba EWMA kernels - recursive equivalents of pandas ewm(span, adjust=False)
+Operate on float32/float64 NumPy arrays so the walk-forward loop avoids pandas per-call overhead
+Numba compiles one specialization per input dtype, so float32 inputs stay float32 end to end
+"""
+
+import numpy as np
+
+from utils._njit import njit
+
+
+@njit(cache=True)
+def ewma_cross_alpha(p, alpha_fast, alpha_slow):
+    """
+    Raw EWMA crossover signal (fast EWMA - slow EWMA) / price in a single pass
+
+    Advances both recurrences in lock-step so neither EWMA is materialized.
+    Missing prices are skipped like pandas ewm(adjust=False): both averages keep
+    their state (their weight still decays) and the signal is NaN on that row.
+
+    Args:
+        p (np.ndarray): Prices, float32 or float64
+        alpha_fast (float): Fast EWMA smoothing factor, 2 / (span + 1)
+        alpha_slow (float): Slow EWMA smoothing factor, 2 / (span + 1)
+
+    Returns:
+        np.ndarray: Raw signal, same length as p (NaN where p is NaN)
+    """
+    out = np.empty_like(p)
+    fast = np.nan
+    slow = np.nan
+    fast_wt = 1.0
+    slow_wt = 1.0
+    for i in range(len(p)):
+        cur = p[i]
+        if fast != fast:
+            # Still waiting for the first observation
+            if cur == cur:
+                fast = cur
+                slow = cur
+                out[i] = 0.0
+            else:
+                out[i] = np.nan
+            continue
+
+        fast_wt *= 1.0 - alpha_fast
+        slow_wt *= 1.0 - alpha_slow
+        if cur != cur:
+            out[i] = np.nan
+            continue
+
+        fast = (fast_wt * fast + alpha_fast * cur) / (fast_wt + alpha_fast)
+        slow = (slow_wt * slow + alpha_slow * cur) / (slow_wt + alpha_slow)
+        fast_wt = 1.0
+        slow_wt = 1.0
+        out[i] = (fast - slow) / cur
+    return out
+
+
+@njit(cache=True)
+def ewm_std_span(x, span):
+    """
+    Exponentially weighted standard deviation, same as pd.Series.ewm(span, adjust=False).std()
+
+    Bias-corrected like pandas; leading NaNs (e.g. from pct_change) are skipped.
+
+    Args:
+        x (np.ndarray): Input values, float32 or float64
+        span (int): EWMA span
+
+    Returns:
+        np.ndarray: EW standard deviation of x (NaN until two observations are seen)
+    """
+    alpha = 2.0 / (span + 1.0)
+    decay = 1.0 - alpha
+    out = np.empty_like(x)
+    mean = np.nan
+    var = 0.0
+    sum_wt = 1.0
+    sum_wt2 = 1.0
+    old_wt = 1.0
+    for i in range(len(x)):
+        cur = x[i]
+        if mean != mean:
+            # Still waiting for the first observation
+            if cur == cur:
+                mean = cur
+            out[i] = np.nan
+            continue
+
+        sum_wt *= decay
+        sum_wt2 *= decay * decay
+        old_wt *= decay
+        if cur == cur:
+            old_mean = mean
+            if mean != cur:
+                mean = (old_wt * old_mean + alpha * cur) / (old_wt + alpha)
+            var = (old_wt * (var + (old_mean - mean) ** 2) + alpha * (cur - mean) ** 2) / (old_wt + alpha)
+            sum_wt = (sum_wt + alpha) / (old_wt + alpha)
+            sum_wt2 = (sum_wt2 + alpha * alpha) / ((old_wt + alpha) * (old_wt + alpha))
+            old_wt = 1.0
+
+        # Bias-corrected variance
+        numerator = sum_wt * sum_wt
+        denominator = numerator - sum_wt2
+        if denominator > 0.0:
+            out[i] = np.sqrt(max(numerator / denominator * var, 0.0))
+        else:
+            out[i] = np.nan
+    return out
+
+
+@njit(cache=True)
+def ewm_std_rows(x, span):
+    """
+    Row-wise ewm_std_span over a 2-D array (one independent window per row)
+
+    Args:
+        x (np.ndarray): 2-D input values, float32 or float64
+        span (int): EWMA span
+
+    Returns:
+        np.ndarray: EW standard deviation of each row
+    """
+    out = np.empty_like(x)
+    for k in range(x.shape[0]):
+        out[k] = ewm_std_span(x[k], span)
+    return out
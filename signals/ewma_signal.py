@@ -6,6 +6,11 @@ Generates forecasts on a -20 to 20 scale (universal forecast standard)
 import pandas as pd
 import numpy as np
 
+from signals import _ewma_numba
+from utils._aot import load_kernel
+
+ewma_cross_alpha = load_kernel(_ewma_numba.ewma_cross_alpha)
+
 
 class EWMASignal:
     """
@@ -14,6 +19,8 @@ class EWMASignal:
     Attributes:
         fast (int): Fast EMA span
         slow (int): Slow EMA span
+        alpha_fast (float): Fast EMA smoothing factor, 2 / (fast + 1)
+        alpha_slow (float): Slow EMA smoothing factor, 2 / (slow + 1)
     """
 
     def __init__(self, fast, slow):
@@ -26,8 +33,27 @@ class EWMASignal:
         """
         self.fast = fast
         self.slow = slow
+        self.alpha_fast = 2.0 / (fast + 1)
+        self.alpha_slow = 2.0 / (slow + 1)
         self.name = f"EWMA_{fast}_{slow}"
 
+    def precompute(self, prices, dtype=np.float64):
+        """
+        Calculate the raw (unscaled) signal once over the full price history
+
+        EWMA is a recursive one-pass filter, so the result can be sliced per
+        train/test window instead of being recomputed on every window.
+
+        Args:
+            prices (pd.Series): Full price history
+            dtype (np.dtype): Float precision of the calculation (float32 or float64)
+
+        Returns:
+            pd.Series: Raw signal (fast EWMA - slow EWMA) / price
+        """
+        raw_signal = ewma_cross_alpha(prices.to_numpy(dtype=dtype), self.alpha_fast, self.alpha_slow)
+        return pd.Series(raw_signal, index=prices.index)
+
     def get_forecast(self, prices, train_prices=None):
         """
         Generate forecast signal on -20 to 20 scale
@@ -40,23 +66,14 @@ class EWMASignal:
         Returns:
             pd.Series: Forecast values between -20 and 20
         """
-        # Use training prices for scaling if provided, else use test prices
-        scaling_data = train_prices if train_prices is not None else prices
-
-        # Step 1: Calculate EWMA
-        fast_ewma = prices.ewm(span=self.fast, adjust=False).mean()
-        slow_ewma = prices.ewm(span=self.slow, adjust=False).mean()
-
-        # Step 2: Get raw signal
-        raw_signal = (fast_ewma - slow_ewma) / prices
+        # Step 1: Get raw signal
+        raw_signal = self.precompute(prices)
 
-        # Step 3: Calculate scaling factor from training data
-        scaling_data_ewma = scaling_data.ewm(span=self.fast, adjust=False).mean()
-        scaling_data_slow = scaling_data.ewm(span=self.slow, adjust=False).mean()
-        scaling_raw = (scaling_data_ewma - scaling_data_slow) / scaling_data
+        # Step 2: Calculate scaling factor from training data if provided, else test prices
+        scaling_raw = self.precompute(train_prices) if train_prices is not None else raw_signal
         scaling_factor = 10 / scaling_raw.abs().mean()
 
-        # Step 4: Scale forecast to -20 to 20 range
+        # Step 3: Scale forecast to -20 to 20 range
         forecast = (raw_signal * scaling_factor).clip(-20, 20)
 
         return forecast
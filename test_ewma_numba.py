@@ -0,0 +1,32 @@
+import pandas as pd
+import numpy as np
+
+from signals._ewma_numba import ewma_cross_alpha
+
+
+def pandas_ewma_cross(prices, fast, slow):
+    """Raw EWMA crossover signal computed with pandas, the reference for the Numba kernel"""
+    fast_ewma = prices.ewm(span=fast, adjust=False).mean()
+    slow_ewma = prices.ewm(span=slow, adjust=False).mean()
+    return (fast_ewma - slow_ewma) / prices
+
+
+def test_ewma_cross_matches_pandas_with_gaps():
+    rng = np.random.default_rng(0)
+    prices = pd.Series(30000 * np.exp(np.cumsum(rng.normal(0, 0.03, 500))))
+
+    # Missing closes: leading, single and consecutive gaps
+    prices.iloc[[0, 100, 250, 251, 252]] = np.nan
+
+    for fast, slow in [(4, 16), (16, 64)]:
+        expected = pandas_ewma_cross(prices, fast, slow).to_numpy()
+        actual = ewma_cross_alpha(prices.to_numpy(), 2.0 / (fast + 1), 2.0 / (slow + 1))
+
+        # NaN only on the missing rows, pandas values everywhere else
+        assert np.array_equal(np.isnan(actual), prices.isna().to_numpy())
+        assert np.allclose(actual, expected, equal_nan=True)
+
+
+if __name__ == "__main__":
+    test_ewma_cross_matches_pandas_with_gaps()
+    print("ok")
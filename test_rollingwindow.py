@@ -11,36 +11,22 @@ df.columns = ['time']
 
 def RollingWindow(df: pd.DataFrame): 
 
-    start = 0 
-    curr = 0 
     end = len(df) # 100 entries 
     slices = 20 
     increment = int(end/slices) # train window is 5
     desired_window_size = 10 # desired_window size is 10
 
-    while curr < (end - increment):
-        
-        # train indexes 
-        train_idx_front = start 
-        train_idx_back = curr + increment
-        curr_win_size = train_idx_back - train_idx_front 
+    # walk-forward indexes, computed once 
+    # train window expands until desired size is reached, then rolls 
+    test_starts = np.arange(increment, end, increment)
+    train_idx = (np.maximum(test_starts - desired_window_size, 0), test_starts)
+    test_idx = (test_starts, test_starts + increment)
 
-        # test indexes
-        test_idx_front = train_idx_back 
-        test_idx_back = test_idx_front + increment 
+    for train_idx_front, train_idx_back, test_idx_front, test_idx_back in zip(*train_idx, *test_idx):
 
         # Obtain train and test data 
         train_df = df.iloc[train_idx_front:train_idx_back] 
         test_df = df.iloc[test_idx_front:test_idx_back]
-        
-        # increment window until desired size is reached
-        if curr_win_size == desired_window_size: 
-
-            # move start pointer to curr pointer's position
-            start = curr 
-
-        # increment curr pointer 
-        curr += increment 
     
     
 
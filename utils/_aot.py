@@ -0,0 +1,82 @@
+"""
+Optional ahead-of-time compiled kernels - built by build_aot.py into the backtest_kernels module
+Each kernel is exported once per float dtype (suffix _f4 / _f8); other inputs use the @njit version
+Kernel modules bind their public names through load_kernel(), so the AOT build is used when
+available and up to date, else the @njit kernel
+"""
+
+import hashlib
+import os
+import warnings
+
+import numpy as np
+
+try:
+    import backtest_kernels
+except ImportError:  # pragma: no cover - AOT module is optional
+    backtest_kernels = None
+
+AOT_SUFFIXES = {np.dtype(np.float32): "_f4", np.dtype(np.float64): "_f8"}
+
+# Kernel sources compiled into backtest_kernels, relative to the repo root
+KERNEL_SOURCES = ("signals/_ewma_numba.py", "backtesting/_backtest_numba.py")
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def source_hash():
+    """
+    Hash of the kernel sources, stored in backtest_kernels when it is built
+
+    Returns:
+        int: First 60 bits of the SHA-256 of KERNEL_SOURCES (fits an int64 export)
+    """
+    digest = hashlib.sha256()
+    for path in KERNEL_SOURCES:
+        with open(os.path.join(REPO_ROOT, path), "rb") as f:
+            digest.update(f.read())
+    return int(digest.hexdigest()[:15], 16)
+
+
+# A build from older kernel sources would silently run stale code, use the @njit kernels instead
+if backtest_kernels is not None and (
+    not hasattr(backtest_kernels, "source_hash") or backtest_kernels.source_hash() != source_hash()
+):
+    warnings.warn(
+        "backtest_kernels is out of date with the kernel sources, using the @njit kernels; "
+        "rebuild it with: python build_aot.py",
+        RuntimeWarning,
+    )
+    backtest_kernels = None
+
+
+def load_kernel(fallback, ndim=1):
+    """
+    Prefer the AOT-compiled build of a Numba kernel, falling back to the JIT version
+
+    Compiled exports have fixed signatures and do not check their inputs, so they
+    are only called with arrays of the dtype and dimension they were built for.
+
+    Args:
+        fallback: @njit kernel, its __name__ is the export name prefix
+        ndim (int): Dimension of the kernel's first (array) argument
+
+    Returns:
+        callable: Kernel taking the same arguments as fallback
+    """
+    name = fallback.__name__
+    compiled = {}
+    if backtest_kernels is not None:
+        for dtype, suffix in AOT_SUFFIXES.items():
+            if hasattr(backtest_kernels, name + suffix):
+                compiled[dtype] = getattr(backtest_kernels, name + suffix)
+    if not compiled:
+        return fallback
+
+    def kernel(x, *args):
+        if isinstance(x, np.ndarray) and x.ndim == ndim and x.dtype in compiled:
+            return compiled[x.dtype](x, *args)
+        return fallback(x, *args)
+
+    kernel.__name__ = name
+    kernel.__doc__ = fallback.__doc__
+    return kernel
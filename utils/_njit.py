@@ -0,0 +1,18 @@
+"""
+Optional Numba JIT - compiled kernels fall back to plain Python when numba is not installed
+"""
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba is optional
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit supporting both @njit and @njit(...)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator